@@ -6,32 +6,46 @@ PoreSippr, allowing users to start a run and view the summary as it is
 processed in real-time. The GUI is created using PySide6 and Qt Designer.
 """
 # Standard library imports
+from contextlib import contextmanager
 import csv
+from functools import partial
 from glob import glob
+import math
 import multiprocessing
 import os
 import re
 import signal
+import socket
 import sys
 import time
 
 # Third party imports
 from PySide6.QtCore import (
-    QCoreApplication,
+    QElapsedTimer,
     QEvent,
+    QFileSystemWatcher,
+    QMargins,
+    QObject,
     QPoint,
+    QRect,
+    QRunnable,
     QSize,
+    QSocketNotifier,
     QThread,
-    QTime,
+    QThreadPool,
     QTimer,
     Qt,
-    Signal
+    Signal,
+    Slot
 )
 from PySide6.QtGui import (
     QColor,
     QFontDatabase,
     QIcon,
+    QImage,
     QImageReader,
+    QMouseEvent,
+    QPainter,
     QPixmap
 )
 from PySide6.QtWidgets import (
@@ -40,7 +54,7 @@ from PySide6.QtWidgets import (
     QComboBox,
     QDialog,
     QFileDialog,
-    QGraphicsDropShadowEffect,
+    QFrame,
     QHBoxLayout,
     QHeaderView,
     QLabel,
@@ -61,28 +75,191 @@ from PySide6.QtWidgets import (
 )
 
 # Local imports
+import fonts_rc  # noqa: F401 (registers the :/fonts resources)
 from methods import (
     determine_script_path,
     is_valid_fasta,
-    main,
+    run_main,
 )
 from ui_main import Ui_MainWindow
 from version import __version__
 
+# Application-wide style sheet. The top button frame (and everything in it)
+# is styled by its maximized property, so maximizing and restoring the
+# window only re-polishes the frame rather than re-parsing a style sheet
+APP_STYLE_SHEET = """
+#frame_top_btns, #frame_top_btns * {
+    background-color: rgba(27, 29, 35, 200);
+}
+#frame_top_btns[maximized="true"], #frame_top_btns[maximized="true"] * {
+    background-color: rgb(27, 29, 35);
+}
+"""
+
+# Style sheet of the run configuration dialog. It is applied once to the
+# dialog, rather than parsing a separate style sheet for each of its widgets
+CONFIGURE_DIALOG_STYLE_SHEET = """
+QDialog {
+    background-color: #f0f0f0;
+}
+QPushButton {
+    border: 1px solid #007bff;  /* Blue border */
+    border-radius: 4px;         /* Rounded corners */
+    background-color: #007bff;  /* Blue background */
+    color: white;               /* White text */
+    padding: 5px 10px;          /* Padding */
+}
+QPushButton:hover {
+    background-color: #0056b3;  /* Darker blue on hover */
+}
+QPushButton:pressed {
+    background-color: #003f7f;  /* Even darker blue on press */
+}
+QPushButton[selected="true"] {
+    border: 1px solid #28a745;  /* Green border */
+    background-color: #28a745;  /* Green background */
+}
+QPushButton[selected="true"]:hover {
+    background-color: #218838;  /* Darker green on hover */
+}
+QPushButton[selected="true"]:pressed {
+    background-color: #1e7e34;  /* Darker still on press */
+}
+QLineEdit, QComboBox, QCheckBox {
+    border: 1px solid #ced4da;
+    border-radius: 4px;
+    padding: 5px;
+}
+QLabel {
+    font-weight: bold;
+}
+QComboBox#lab_name_dropdown {
+    border: 1px solid #007bff;
+}
+QComboBox#lab_name_dropdown::drop-down {
+    border: 0px;
+}
+QComboBox#lab_name_dropdown::down-arrow {
+    image: url(:/20x20/icons/20x20/cil-chevron-bottom.png);
+    width: 14px;
+    height: 14px;
+    subcontrol-origin: padding;
+    subcontrol-position: center right;
+    right: 5px;
+}
+QComboBox#lab_name_dropdown QAbstractItemView::item {
+    height: 25px;
+}
+QComboBox#lab_name_dropdown QAbstractItemView::item:selected,
+QComboBox#lab_name_dropdown QAbstractItemView::item:hover {
+    background-color: #007bff;
+    color: white;
+}
+QComboBox#lab_name_dropdown QAbstractItemView {
+    selection-background-color: #007bff;
+    selection-color: white;
+}
+QListWidget#barcode_list_widget {
+    border: 1px solid #007bff;
+    border-radius: 4px;
+    background-color: #f0f0f0;
+    color: #333;
+}
+QListWidget#barcode_list_widget::item {
+    height: 15px;  /* Increase item height */
+    padding: 5px;  /* Add some padding for text */
+}
+QListWidget#barcode_list_widget::item:selected {
+    background-color: #007bff;
+    color: white;
+}
+"""
+
+# Draw a drop shadow around the main frame. The shadow is copied from a
+# cached pixmap, so it is cheap enough to leave on by default
+ENABLE_DROP_SHADOW = True
+
+# Color and blur radius of the drop shadow around the main frame, and the
+# width of the window margin it is drawn in
+SHADOW_COLOR = QColor(0, 0, 0, 150)
+SHADOW_BLUR_RADIUS = 17
+SHADOW_MARGIN = 10
+
+# Margin between the window edge and the main frame. It only exists to hold
+# the shadow, so the main frame fills the window when the shadow is disabled
+WINDOW_MARGIN = SHADOW_MARGIN if ENABLE_DROP_SHADOW else 0
+
+# Contents margins of the top button frame when the standard title bar is
+# used instead of the custom one
+TITLE_BAR_MARGINS = QMargins(8, 0, 0, 5)
+
+# Qt enum values checked in the mouse and window event handlers, looked up
+# once rather than on every event
+LEFT_BUTTON = Qt.MouseButton.LeftButton
+WINDOW_STATE_CHANGE = QEvent.WindowStateChange
+
+# Connection type of the title bar buttons: queued and unique. PySide6 does
+# not support | between ConnectionType members, so combine their values.
+# Qt.ConnectionType accepts the combined value, and QObject::connect reads
+# it as the same bit mask as in C++, so a repeated connect is rejected and
+# the slot is still queued
+QUEUED_UNIQUE_CONNECTION = Qt.ConnectionType(
+    Qt.QueuedConnection.value | Qt.UniqueConnection.value
+)
+
+# Interval in milliseconds of the fallback timer that rescans the image
+# directory during a run
+IMAGE_SCAN_INTERVAL = 500
+
+# Number of pages either side of the current page whose HTML is kept loaded
+RENDERED_PAGE_RADIUS = 1
+
+# Start the PoreSippr process with spawn rather than fork, so the child does
+# not inherit the Qt state of the GUI process
+SPAWN_CONTEXT = multiprocessing.get_context('spawn')
+
+
+@contextmanager
+def batched_updates(widget, block_signals=False):
+    """
+    Context manager that suspends updates (and optionally signals) of a
+    widget, so the changes made inside the block are laid out and painted
+    once. The previous state is restored on exit, so batches can be nested.
+
+    :param widget: The widget to suspend updates for.
+    :param block_signals: Also block the signals of the widget.
+    """
+    # Store the current state, and suspend updates and signals
+    updates_enabled = widget.updatesEnabled()
+    widget.setUpdatesEnabled(False)
+    signals_blocked = widget.blockSignals(True) if block_signals else None
+    try:
+        yield widget
+    finally:
+        # Restore the previous state, and repaint once
+        if block_signals:
+            widget.blockSignals(signals_blocked)
+        widget.setUpdatesEnabled(updates_enabled)
+        if updates_enabled:
+            widget.update()
+
 
 class Worker(QThread):
     """
-    Worker thread class for running the .main
+    Worker thread class for running the .main in a separate process, so the
+    CSV parsing and HTML generation never compete with the GUI for the GIL
     """
     finished = Signal()
 
     # Signal for errors
     error = Signal(str)
 
+    # Signal emitted once .main has recreated the output folder
+    output_ready = Signal()
+
     def __init__(
             self, folder_path, output_folder, csv_path, complete,
-            configuration_file, metadata_file, lab_name, run_name,
-            pid_store=None):
+            configuration_file, metadata_file, lab_name, run_name):
         super().__init__()
         self.folder_path = folder_path
         self.output_folder = output_folder
@@ -92,12 +269,20 @@ class Worker(QThread):
         self.metadata_file = metadata_file
         self.lab_name = lab_name
         self.run_name = run_name
-        self.pid_store = pid_store
         self.error_message = str()
 
+        # Create a shared value for the PID of the basecalling process
+        # started by .main. It is only written once, so it does not need a
+        # lock
+        self.basecall_pid = SPAWN_CONTEXT.Value('i', 0, lock=False)
+
+        # Initialise the process running .main
+        self.process = None
+
     def run(self):
         """
-        Run the worker thread.
+        Run the worker thread. Starts .main in a process using the spawn
+        start method, and waits for it to exit.
         """
         try:
             # Determine the script path
@@ -114,21 +299,52 @@ class Worker(QThread):
             print('metadata_file', self.metadata_file)
             print('lab_name', self.lab_name)
             print('run_name', self.run_name)
-            print('pid_store', self.pid_store)
             print('test_mode', test_mode)
 
-            main(
-                folder_path=self.folder_path,
-                output_folder=self.output_folder,
-                csv_path=self.csv_path,
-                complete=self.complete,
-                config_file=self.configuration_file,
-                metadata_file=self.metadata_file,
-                lab_name=self.lab_name,
-                run_name=self.run_name,
-                test=test_mode,
-                pid_store=self.pid_store
+            # Create a queue to receive any error raised by .main
+            error_queue = SPAWN_CONTEXT.SimpleQueue()
+
+            # Create an event set by .main once it has recreated the output
+            # folder
+            output_ready = SPAWN_CONTEXT.Event()
+
+            # Create the process running .main. It is a daemon, so it does
+            # not outlive the GUI
+            self.process = SPAWN_CONTEXT.Process(
+                target=run_main,
+                args=(error_queue,),
+                kwargs=dict(
+                    folder_path=self.folder_path,
+                    output_folder=self.output_folder,
+                    csv_path=self.csv_path,
+                    complete=self.complete,
+                    config_file=self.configuration_file,
+                    metadata_file=self.metadata_file,
+                    lab_name=self.lab_name,
+                    run_name=self.run_name,
+                    test=test_mode,
+                    basecall_pid=self.basecall_pid,
+                    output_ready=output_ready
+                ),
+                daemon=True
             )
+            self.process.start()
+
+            # Wait for .main to recreate the output folder, unless the
+            # process exits before getting that far. Until then the folder
+            # still holds the summaries of the previous run
+            while not output_ready.wait(timeout=0.5):
+                if not self.process.is_alive():
+                    break
+            if output_ready.is_set():
+                self.output_ready.emit()
+
+            # Wait for the process to exit
+            self.process.join()
+
+            # Raise any error reported by .main
+            if not error_queue.empty():
+                raise RuntimeError(error_queue.get())
 
         except Exception as exc:
             self.error_message = str(exc)
@@ -137,6 +353,44 @@ class Worker(QThread):
             self.finished.emit()
 
 
+class HtmlLoaderSignals(QObject):
+    """
+    Signals for the HtmlLoader. QRunnable is not a QObject, so the signals
+    are hosted on a separate object
+    """
+    # Signal for the path and contents of the HTML file
+    loaded = Signal(str, str)
+
+
+class HtmlLoader(QRunnable):
+    """
+    Runnable for reading an HTML summary in the global thread pool, so that
+    the GUI thread is not blocked while the file is read
+    """
+
+    def __init__(self, html_path):
+        super().__init__()
+        self.html_path = html_path
+        self.signals = HtmlLoaderSignals()
+
+    def run(self):
+        """
+        Read the HTML file and emit its contents. Each summary is written
+        once, when its iteration is complete, and renamed into place, so the
+        file is complete as soon as it exists.
+        """
+        try:
+            # Read the HTML file
+            with open(self.html_path, 'r') as f:
+                html_content = f.read()
+        except FileNotFoundError:
+            # The file was removed (e.g. by a new run) before it could be
+            # read. Do not tie up a pool thread waiting for it to reappear
+            return
+
+        self.signals.loaded.emit(self.html_path, html_content)
+
+
 class CustomTableWidget(QTableWidget):
     """
     A subclass of QTableWidget that supports pasting multiple cells from the
@@ -195,6 +449,45 @@ class CustomMessageBox(QMessageBox):
     A custom QMessageBox class that applies a specific stylesheet to all
     instances of QMessageBox, giving it a modern/bootstrap look without icons.
     """
+    # The style sheet is shared by every message box, so the string is only
+    # built once
+    STYLE_SHEET = """
+    QPushButton {
+        border: 1px solid #007bff;  /* Blue border */
+        border-radius: 4px;         /* Rounded corners */
+        background-color: #007bff;  /* Blue background */
+        color: white;               /* White text */
+        padding: 5px 10px;          /* Padding */
+        font: bold;                 /* Bold font */
+    }
+    QPushButton:hover {
+        background-color: #0056b3;  /* Darker blue on hover */
+    }
+    QPushButton:pressed {
+        background-color: #003f7f;  /* Even darker blue on press */
+    }
+    QPushButton#Yes {
+        background-color: #28a745;  /* Green for Yes */
+        border: 1px solid #28a745;  /* Green border */
+    }
+    QPushButton#Yes:hover {
+        background-color: #218838;  /* Darker green on hover */
+    }
+    QPushButton#Yes:pressed {
+        background-color: #1e7e34;  /* Even darker green on press */
+    }
+    QPushButton#Cancel {
+        background-color: #dc3545;  /* Red for Cancel */
+        border: 1px solid #dc3545;  /* Red border */
+    }
+    QPushButton#Cancel:hover {
+        background-color: #c82333;  /* Darker red on hover */
+    }
+    QPushButton#Cancel:pressed {
+        background-color: #bd2130;  /* Even darker red on press */
+    }
+"""
+
     def __init__(self, *args, **kwargs):
         """
         Initialize the CustomMessageBox with the specified stylesheet.
@@ -203,44 +496,7 @@ class CustomMessageBox(QMessageBox):
         :param kwargs: Keyword arguments passed to the parent QMessageBox.
         """
         super().__init__(*args, **kwargs)
-        self.setStyleSheet(
-            """
-            QPushButton {
-                border: 1px solid #007bff;  /* Blue border */
-                border-radius: 4px;         /* Rounded corners */
-                background-color: #007bff;  /* Blue background */
-                color: white;               /* White text */
-                padding: 5px 10px;          /* Padding */
-                font: bold;                 /* Bold font */
-            }
-            QPushButton:hover {
-                background-color: #0056b3;  /* Darker blue on hover */
-            }
-            QPushButton:pressed {
-                background-color: #003f7f;  /* Even darker blue on press */
-            }
-            QPushButton#Yes {
-                background-color: #28a745;  /* Green for Yes */
-                border: 1px solid #28a745;  /* Green border */
-            }
-            QPushButton#Yes:hover {
-                background-color: #218838;  /* Darker green on hover */
-            }
-            QPushButton#Yes:pressed {
-                background-color: #1e7e34;  /* Even darker green on press */
-            }
-            QPushButton#Cancel {
-                background-color: #dc3545;  /* Red for Cancel */
-                border: 1px solid #dc3545;  /* Red border */
-            }
-            QPushButton#Cancel:hover {
-                background-color: #c82333;  /* Darker red on hover */
-            }
-            QPushButton#Cancel:pressed {
-                background-color: #bd2130;  /* Even darker red on press */
-            }
-            """
-        )
+        self.setStyleSheet(self.STYLE_SHEET)
 
 
 class LargeEditorDelegate(QStyledItemDelegate):
@@ -296,6 +552,21 @@ class MainWindow(QMainWindow):
         # Set up the signal handler for SIGINT (Ctrl+C)
         signal.signal(signal.SIGINT, self.signal_handler)
 
+        # Python only runs signal handlers between bytecodes, which never
+        # happens while Qt's event loop is idle. Have the interpreter write a
+        # byte to a socket whenever a signal arrives, and watch the other end
+        # with a QSocketNotifier, so the event loop wakes up exactly when
+        # needed. A socket pair is used, as set_wakeup_fd on Windows only
+        # accepts sockets
+        self._signal_reader, self._signal_writer = socket.socketpair()
+        self._signal_reader.setblocking(False)
+        self._signal_writer.setblocking(False)
+        signal.set_wakeup_fd(self._signal_writer.fileno())
+        self._signal_notifier = QSocketNotifier(
+            self._signal_reader.fileno(), QSocketNotifier.Read, self
+        )
+        self._signal_notifier.activated.connect(self._on_signal_wakeup)
+
         # Create the user interface
         self.user_interface = Ui_MainWindow()
         self.user_interface.setupUi(self)
@@ -304,6 +575,11 @@ class MainWindow(QMainWindow):
         # Define class variables
         self.drag_pos = QPoint()
 
+        # Initialise the cached list of images, and the image directory
+        # modification time used to validate it
+        self._cached_images = []
+        self._cached_mtime = None
+
         # Disables the left and right buttons until images are added
         self.update_button_states()
 
@@ -357,25 +633,26 @@ class MainWindow(QMainWindow):
         # Determine the base path of the current Python file
         script_path = determine_script_path()
 
-        # Set the application icon for the system taskbar
-        image_path = os.path.join(script_path, 'cfia.jpg')
-        if os.path.exists(image_path):
-            if QImageReader(image_path).canRead():
-                app_icon = QIcon(image_path)
-                self.setWindowIcon(app_icon)
-                QApplication.setWindowIcon(app_icon)
+        # Store the path of the application icon. It is decoded by
+        # load_app_icon once the event loop is running
+        self.app_icon_path = os.path.join(script_path, 'cfia.jpg')
 
-        # Set the user icon for the label
-        user_icon_path = os.path.join(
-            script_path,
-            'icons/24x24/olcConfindrLogo.png'
-        )
+        # Set the user icon for the label from the compiled resources, so it
+        # is not read from the filesystem
+        user_icon = QPixmap(':/24x24/icons/24x24/olcConfindrLogo.png')
 
-        if os.path.exists(user_icon_path):
+        if not user_icon.isNull():
+            # The label has a fixed size, so scale the icon to it once with
+            # smooth filtering, rather than having the label rescale the
+            # pixmap on every paint
             self.user_interface.label_user_icon.setPixmap(
-                QPixmap(user_icon_path)
+                user_icon.scaled(
+                    self.user_interface.label_user_icon.maximumSize(),
+                    Qt.KeepAspectRatio,
+                    Qt.SmoothTransformation
+                )
             )
-            self.user_interface.label_user_icon.setScaledContents(True)
+            self.user_interface.label_user_icon.setScaledContents(False)
             self.user_interface.label_user_icon.setAlignment(
                 Qt.AlignmentFlag.AlignCenter
             )
@@ -390,26 +667,19 @@ class MainWindow(QMainWindow):
         # Set the cancel button to be checkable
         self.user_interface.cancel_button.setEnabled(False)
 
+        # Connect the cancel button to the cancel_clicker method
+        self.user_interface.cancel_button.clicked.connect(self.cancel_clicker)
+
         # Initialize the left and right buttons
         self.user_interface.left_button.clicked.connect(
-            lambda: [
-                self.user_interface.progress_widget.setCurrentIndex(
-                    self.user_interface.progress_widget.currentIndex() - 1
-                ),
-                self.update_button_states()
-            ]
+            self.show_previous_page
         )
 
         # Disables the left button until images are added
         self.user_interface.left_button.setEnabled(False)
 
         self.user_interface.right_button.clicked.connect(
-            lambda: [
-                self.user_interface.progress_widget.setCurrentIndex(
-                    self.user_interface.progress_widget.currentIndex() + 1
-                ),
-                self.update_button_states()
-            ]
+            self.show_next_page
         )
 
         # Disable the right button until images are added
@@ -433,32 +703,68 @@ class MainWindow(QMainWindow):
         # Set the version
         self.user_interface.label_version.setText(f"Version: {__version__}")
 
-        # Create a timer to show the elapsed time of the run
+        # Create a timer to show the elapsed time of the run. It is only
+        # started and stopped for each run, so it is connected once here
         self.timer = QTimer()
+        self.timer.timeout.connect(self.lcd_number)
 
-        # Initialize a flag to track if the signal is connected
-        self.is_lcd_number_connected = False
-
-        # Initialise the timer to 0:00:00
-        self.time = QTime(0, 0)
+        # Measure the elapsed time of the run from a monotonic clock, and
+        # track the last second shown, so the LCD is only repainted when the
+        # displayed value changes
+        self.elapsed = QElapsedTimer()
+        self._last_secs = 0
 
         # Set number of LCD digits
         self.user_interface.lcd_display.setDigitCount(8)
 
-        # Display the initial time on the LCD
-        time_str = self.time.toString('hh:mm:ss')
-        self.user_interface.lcd_display.display(time_str)
-
-        # Create a timer to update the page label
-        self.user_interface.page_label_timer = QTimer()
+        # Display the initial time on the LCD, tracking the last string
+        # displayed so unchanged values are not repainted
+        self._lcd_last = ''
+        self.display_lcd('00:00:00')
 
-        # Connect the timeout signal to the update_page_label method
-        self.user_interface.page_label_timer.timeout.connect(
+        # Update the page label whenever the current page changes. Pages
+        # being added are handled explicitly in add_html_to_gui
+        self.user_interface.progress_widget.currentChanged.connect(
             self.update_page_label
         )
 
-        # Update the page label every second
-        self.user_interface.page_label_timer.start(10)
+        # Load the HTML of the pages around the current page whenever it
+        # changes, and release the HTML of pages further away
+        self.user_interface.progress_widget.currentChanged.connect(
+            self.render_visible_pages
+        )
+
+        # Create a file system watcher to add new HTML files to the GUI as
+        # they are written to the image directory
+        self.fs_watcher = QFileSystemWatcher(self)
+        self.fs_watcher.directoryChanged.connect(self._on_dir_changed)
+
+        # Use a slow timer as a fallback to pick up any changes the watcher
+        # misses, and to re-add the directory if it is recreated
+        self.image_timer = QTimer(self)
+        self.image_timer.setInterval(IMAGE_SCAN_INTERVAL)
+        self.image_timer.timeout.connect(self._on_dir_changed)
+
+        # Initialise the set of images added to the GUI
+        self._known_images = set()
+
+        # The image directory is only read once the PoreSippr process has
+        # recreated it for the current run
+        self.image_directory_ready = False
+
+        # Initialise the QTextBrowsers waiting for their HTML to be read
+        self.pending_html = {}
+
+        # Initialise the pages in the progress_widget, and the pool of pages
+        # from previous runs available for reuse. Both store (page,
+        # QTextBrowser) tuples, so the browser never needs to be looked up
+        self.pages = []
+        self.page_pool = []
+
+        # Initialise the HTML file shown by each page, and the indices of the
+        # pages whose QTextBrowser currently holds (or is loading) its HTML
+        self.page_paths = []
+        self.rendered_pages = set()
 
         # Initialise the PoreSippr parsing process
         self.process = None
@@ -505,13 +811,28 @@ class MainWindow(QMainWindow):
         # Initialise a list to store barcode: seqid: olnid information
         self.sequence_info = []
 
-        # Initialise the list of external process PIDs
-        self.pid_store = []
-
         # Show the main window
         self.setWindowTitle('PoreSippr')
         self.show()
 
+        # Finish setting up the user interface once the event loop is running
+        QTimer.singleShot(0, self.user_interface_functions.finish_ui_setup)
+
+        # Load the application icon once the window has been shown
+        QTimer.singleShot(0, self.load_app_icon)
+
+    @Slot()
+    def _on_signal_wakeup(self):
+        """
+        Drains the signal wakeup socket. Returning to Python is enough for the
+        interpreter to run the pending signal handler.
+        """
+        try:
+            while self._signal_reader.recv(64):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+
     def signal_handler(self, _, __):
         """
         Handles the SIGINT signal (keyboard interrupt) and prompts the user
@@ -526,14 +847,8 @@ class MainWindow(QMainWindow):
                 QMessageBox.Yes | QMessageBox.Cancel
             )
             if response == QMessageBox.Yes:
-                self.complete = True
-                # Terminate the worker and any external processes
-                self.worker.terminate()
-                for pid in self.pid_store:
-                    try:
-                        os.kill(pid, signal.SIGTERM)
-                    except ProcessLookupError:
-                        pass
+                # Stop the worker and any external processes
+                self.stop_worker()
                 sys.exit(0)  # Exit the application
             else:
                 pass  # Do nothing, continue running
@@ -548,7 +863,7 @@ class MainWindow(QMainWindow):
         event (QMouseEvent): The mouse event triggered by the user.
         """
         # If the left mouse button is pressed, update the drag position
-        if event.buttons() == Qt.MouseButton.LeftButton:
+        if event.buttons() == LEFT_BUTTON:
             self.drag_pos = event.globalPosition().toPoint()
             event.accept()
 
@@ -565,16 +880,7 @@ class MainWindow(QMainWindow):
         # Initialize the dialog
         dialog = QDialog(self)
         dialog.setWindowTitle("Enter PoreSippr Run Data")
-        dialog.setStyleSheet(
-            "QDialog { background-color: #f0f0f0; }"
-            "QPushButton { border: 1px solid #007bff; "
-            "border-radius: 4px; background-color: #007bff; "
-            "color: white; padding: 5px 10px; }"
-            "QLineEdit, QComboBox, QCheckBox { "
-            "border: 1px solid #ced4da; border-radius: 4px; "
-            "padding: 5px; }"
-            "QLabel { font-weight: bold; }"
-        )
+        dialog.setStyleSheet(CONFIGURE_DIALOG_STYLE_SHEET)
 
         # Set up the main layout
         layout = QVBoxLayout(dialog)
@@ -586,45 +892,12 @@ class MainWindow(QMainWindow):
         lab_name_dropdown = QComboBox(dialog)
         lab_name_dropdown.addItems(
             ["BUR", "CAL", "DAR", "FFFM", "GTA", "OLC", "STH"])
-        lab_name_dropdown.setStyleSheet(
-            "QComboBox { border: 1px solid #007bff; border-radius: 4px; "
-            "padding: 5px; }"
-            "QComboBox::drop-down { border: 0px; }"
-            "QComboBox::down-arrow { image: "
-            "url(icons/20x20/cil-chevron-bottom.png); }"
-            "QComboBox::down-arrow { width: 14px; height: 14px; }"
-            "QComboBox::down-arrow { subcontrol-origin: padding; "
-            "subcontrol-position: center right; right: 5px; }"
-            "QComboBox QAbstractItemView::item { height: 25px; }"
-            "QComboBox QAbstractItemView::item:selected { background-color: "
-            "#007bff; color: white; }"
-            "QComboBox QAbstractItemView::item:hover { background-color: "
-            "#007bff; color: white; }"
-            "QComboBox QAbstractItemView { selection-background-color: "
-            "#007bff; selection-color: white; }"
-        )
+        lab_name_dropdown.setObjectName("lab_name_dropdown")
         layout.addWidget(lab_name_dropdown)
 
         # Reference file selection section
         layout.addWidget(QLabel("Reference File"))
         reference_button = QPushButton("Select Reference File", dialog)
-        reference_button.setStyleSheet(
-            """
-            QPushButton {
-                border: 1px solid #007bff;  /* Blue border */
-                border-radius: 4px;         /* Rounded corners */
-                background-color: #007bff;  /* Blue background */
-                color: white;               /* White text */
-                padding: 5px 10px;          /* Padding */
-            }
-            QPushButton:hover {
-                background-color: #0056b3;  /* Darker blue on hover */
-            }
-            QPushButton:pressed {
-                background-color: #003f7f;  /* Even darker blue on press */
-            }
-            """
-        )
         reference_button.clicked.connect(
             lambda: self.select_reference_file(dialog, reference_button)
         )
@@ -659,25 +932,9 @@ class MainWindow(QMainWindow):
 
         # Continue with the QListWidget setup
         barcode_list_widget = QListWidget(dialog)
+        barcode_list_widget.setObjectName("barcode_list_widget")
         barcode_list_widget.setSelectionMode(QAbstractItemView.MultiSelection)
 
-        barcode_list_widget.setStyleSheet("""
-            QListWidget {
-                border: 1px solid #007bff;
-                border-radius: 4px;
-                background-color: #f0f0f0;
-                color: #333;
-            }
-            QListWidget::item {
-                height: 15px; /* Increase item height */
-                padding: 5px; /* Add some padding for text */
-            }
-            QListWidget::item:selected {
-                background-color: #007bff;
-                color: white;
-            }
-        """)
-
         # Add items to the list widget
         for i in range(1, 25):
             barcode_list_widget.addItem(f"{i:02}")
@@ -686,13 +943,6 @@ class MainWindow(QMainWindow):
 
         # Validate button section
         validate_button = QPushButton("Validate", dialog)
-        validate_button.setStyleSheet(
-            "QPushButton { border: 1px solid #007bff; "
-            "border-radius: 4px; background-color: #007bff; "
-            "color: white; padding: 5px 10px; }"
-            "QPushButton:hover { background-color: #0056b3; }"
-            "QPushButton:pressed { background-color: #003f7f; }"
-        )
         validate_button.clicked.connect(
             lambda: self.validate_and_close(
                 window_dialog=dialog,
@@ -719,34 +969,46 @@ class MainWindow(QMainWindow):
         :param button: The button to update with the selected file's name
         and style.
         """
+        # Do not resolve symlinks or look up custom directory icons, as both
+        # cost extra filesystem calls per entry on network mounts. The native
+        # dialog is still used where the platform provides one
         self.reference_file, _ = QFileDialog.getOpenFileName(
             window_dialog,
             caption="Select Reference File",
             dir="",
-            filter="All Files (*)"
+            filter="All Files (*)",
+            options=(
+                QFileDialog.DontResolveSymlinks |
+                QFileDialog.DontUseCustomDirectoryIcons
+            )
         )
         if self.reference_file:
             # Extract the file name from the path
             file_name = os.path.basename(self.reference_file)
 
-            # Update the button text and style
-            button.setText(file_name)
-            button.setStyleSheet(
-                """
-                QPushButton {
-                    border: 1px solid #28a745;  /* Green border */
-                    border-radius: 4px;         /* Rounded corners */
-                    background-color: #28a745;  /* Green background */
-                    color: white;               /* White text */
-                    padding: 5px 10px;          /* Padding */
-                }
-                QPushButton:hover {
-                    background-color: #218838;  /* Darker green on hover */
-                }
-                QPushButton:pressed {
-                    background-color: #1e7e34;  /* Darker still on press */
-                }
-                """
+            # Elide long file names to the current button width once, rather
+            # than letting the button re-measure and grow with the full name
+            elided_name = button.fontMetrics().elidedText(
+                file_name, Qt.ElideMiddle, button.width()
+            )
+
+            # Update the button text and style, keeping the full path
+            # available as a tooltip
+            button.setText(elided_name)
+            button.setToolTip(self.reference_file)
+
+            # Switch to the green style from the dialog style sheet by
+            # setting the selected property, and re-polish the button
+            button.setProperty("selected", True)
+            button.style().unpolish(button)
+            button.style().polish(button)
+
+            # Validate the reference file in the thread pool while the rest
+            # of the dialog is filled in. The result is cached, so
+            # validate_and_close does not have to parse the file on the GUI
+            # thread
+            QThreadPool.globalInstance().start(
+                partial(is_valid_fasta, self.reference_file)
             )
 
     def validate_and_close(
@@ -860,21 +1122,13 @@ class MainWindow(QMainWindow):
             # Enable the sequence info button
             self.user_interface.sequence_info_button.setEnabled(True)
 
-            # Update the configuration_button styling to indicate finalization
-            self.user_interface.configuration_button.setStyleSheet(
-                """
-                QPushButton {
-                    background-color: #5cb85c;
-                    color: white;
-                    font-weight: bold;
-                }
-                QPushButton:disabled {
-                    background-color: #5cb85c;
-                    color: white;
-                    font-weight: bold;
-                }
-            """
-                )
+            # Update the configuration_button styling to indicate
+            # finalization. The finalized rules are already part of the
+            # button's style sheet, so only the property needs to change
+            button = self.user_interface.configuration_button
+            button.setProperty("finalized", True)
+            button.style().unpolish(button)
+            button.style().polish(button)
             self.user_interface.configuration_button.setText(
                 "PoreSippr Run Configured"
                 )
@@ -1045,19 +1299,10 @@ class MainWindow(QMainWindow):
 
                 # Update the sequence_info_button styling to indicate
                 # finalization
-                self.user_interface.sequence_info_button.setStyleSheet(
-                    """
-                    QPushButton {
-                        background-color: #5cb85c;
-                        color: white;
-                        font-weight: bold;
-                    }
-                    QPushButton:disabled {
-                        background-color: #5cb85c;
-                        color: white;
-                    }
-                """
-                    )
+                button = self.user_interface.sequence_info_button
+                button.setProperty("finalized", True)
+                button.style().unpolish(button)
+                button.style().polish(button)
                 self.user_interface.sequence_info_button.setText(
                     "Sequence Information Entered"
                     )
@@ -1209,30 +1454,30 @@ class MainWindow(QMainWindow):
             for row in rows:
                 writer.writerow(row)
 
-    def update_button_states(self) -> list:
+    def update_button_states(self):
         """
         Updates the state of the left and right buttons based on the current
-        page index.
-
-        :return: A list of images in the current directory.
+        page index. The number of pages is taken from the progress_widget,
+        so the image directory is not read on every page change.
         """
-        # Find all the images in the directory
-        images = self.get_images(path=self.image_path)
+        # Get the number of pages and the index of the current page
+        progress_widget = self.user_interface.progress_widget
+        page_count = progress_widget.count()
+        current_index = progress_widget.currentIndex()
 
-        # If there are no images, disable both buttons
-        if not images:
+        # If there are no pages, disable both buttons
+        if not page_count:
             self.user_interface.left_button.setEnabled(False)
             self.user_interface.right_button.setEnabled(False)
 
         # Watches to see which page you are on to disable arrow buttons if
         # you are on one of the extreme pages
-        elif self.user_interface.progress_widget.currentIndex() == 0:
+        elif current_index == 0:
             self.user_interface.left_button.setEnabled(False)
-            # Enable the right button only if there are at least two images
-            self.user_interface.right_button.setEnabled(len(images) >= 2)
+            # Enable the right button only if there are at least two pages
+            self.user_interface.right_button.setEnabled(page_count >= 2)
 
-        elif self.user_interface.progress_widget.currentIndex() == \
-                self.user_interface.progress_widget.count() - 1:
+        elif current_index == page_count - 1:
             self.user_interface.right_button.setEnabled(False)
             self.user_interface.left_button.setEnabled(True)
 
@@ -1240,8 +1485,6 @@ class MainWindow(QMainWindow):
             self.user_interface.left_button.setEnabled(True)
             self.user_interface.right_button.setEnabled(True)
 
-        return images
-
     def update_error_label(self, message):
         """
         Updates the QLabel with the provided error message.
@@ -1255,6 +1498,7 @@ class MainWindow(QMainWindow):
         # Make sure the QLabel is visible
         self.user_interface.run_label_error.show()
 
+    @Slot(QMouseEvent)
     def move_window(self, event):
         """
         Handles the movement of the window when it's dragged with the mouse.
@@ -1268,33 +1512,109 @@ class MainWindow(QMainWindow):
         event (QMouseEvent): The mouse event triggered by the user.
         """
         # If the window is maximized, restore it to its previous size
-        if self.user_interface_functions.return_status():
+        if self.user_interface_functions.is_maximized:
             self.user_interface_functions.maximize_restore()
 
         # If the left mouse button is pressed, move the window
-        if event.buttons() == Qt.MouseButton.LeftButton:
+        if event.buttons() == LEFT_BUTTON:
+            # Get the global mouse position once for this event
+            global_pos = event.globalPosition().toPoint()
             # Calculate the difference between the current mouse position and
             # the position where the drag started
-            diff = event.globalPosition().toPoint() - self.drag_pos
+            diff = global_pos - self.drag_pos
             # Add the difference to the current position of the window
             self.move(self.pos() + diff)
             # Update the position where the drag started
-            self.drag_pos = event.globalPosition().toPoint()
+            self.drag_pos = global_pos
             event.accept()
 
+    @Slot()
     def lcd_number(self):
         """
         This method updates the LCD with the elapsed time.
 
-        It increments the current time by one second, sets the LCD
-        style to flat, sets the number of digits on the LCD to eight, and
-        then displays the updated time on the LCD in the format
-        'hh:mm:ss'.
+        It reads the elapsed time of the run in whole seconds, and displays
+        it on the LCD in the format 'hh:mm:ss'. The LCD is only repainted
+        when the number of seconds has changed.
         """
-        self.time = self.time.addSecs(1)
+        # Determine the elapsed time of the run in seconds
+        secs = self.elapsed.elapsed() // 1000
 
-        # Displays the time
-        self.user_interface.lcd_display.display(self.time.toString('hh:mm:ss'))
+        # Nothing to repaint if the displayed second has not changed
+        if secs == self._last_secs:
+            return
+        self._last_secs = secs
+
+        # Displays the time. The string is formatted directly from the
+        # number of seconds, rather than through a QTime
+        hours, remainder = divmod(secs, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        self.display_lcd(f'{hours:02d}:{minutes:02d}:{seconds:02d}')
+
+    def display_lcd(self, text):
+        """
+        Displays a string on the LCD, unless it is already displayed.
+        QLCDNumber.display repaints the widget even for an unchanged value.
+
+        :param text: The string to display.
+        """
+        if text != self._lcd_last:
+            self.user_interface.lcd_display.display(text)
+            self._lcd_last = text
+
+    @Slot()
+    def load_app_icon(self):
+        """
+        Sets the application icon for the window and the system taskbar. It
+        is posted to the event loop once the window has been shown, so the
+        image is not decoded while the window is being constructed.
+        """
+        # Decode the icon, if it exists and is readable
+        if os.path.exists(self.app_icon_path):
+            if QImageReader(self.app_icon_path).canRead():
+                app_icon = QIcon(self.app_icon_path)
+                self.setWindowIcon(app_icon)
+                QApplication.setWindowIcon(app_icon)
+
+    def paintEvent(self, event):
+        """
+        Draws the drop shadow around frame_main in the margin of the window.
+        There is no margin while the window is maximized, so nothing is drawn.
+
+        :param event: The paint event.
+        """
+        # Let the base class paint the (transparent) window background
+        super().paintEvent(event)
+
+        # Draw the shadow around the main frame, unless it is disabled or
+        # fully transparent
+        if (ENABLE_DROP_SHADOW and SHADOW_COLOR.alpha()
+                and not self.user_interface_functions.is_maximized):
+            frame_main = self.user_interface.frame_main
+            painter = QPainter(self)
+            self.user_interface_functions.draw_shadow(
+                painter,
+                QRect(frame_main.mapTo(self, QPoint(0, 0)), frame_main.size())
+            )
+            painter.end()
+
+    def changeEvent(self, event):
+        """
+        Slows the LCD timer down while the window is minimized, and catches
+        the LCD up as soon as the window is restored.
+
+        :param event: The change event.
+        """
+        # Only window state changes affect the timer
+        if event.type() == WINDOW_STATE_CHANGE and self.timer.isActive():
+            if self.isMinimized():
+                self.timer.setInterval(60000)
+            else:
+                self.timer.setInterval(1000)
+                self.lcd_number()
+
+        # Let the base class handle the event as well
+        super().changeEvent(event)
 
     def on_worker_finished(self):
         """
@@ -1306,8 +1626,10 @@ class MainWindow(QMainWindow):
         # Rechecks the button to false; ensures we don't loop
         self.user_interface.cancel_button.setChecked(False)
 
-        # Enables the run button again after the run is finished or cancelled
-        self.user_interface.run_button.setEnabled(True)
+        # Add any remaining images to the GUI, stop watching the image
+        # directory, and re-enable the run and configuration buttons
+        self._on_dir_changed()
+        self.stop_image_monitoring()
 
         # Check if there was an error and display the appropriate message
         if self.worker.error_message:
@@ -1317,8 +1639,33 @@ class MainWindow(QMainWindow):
                 "Your PoreSippr run has been successfully terminated")
             self.user_interface.run_label_error.show()
 
-        self.worker.terminate()
+        # The finished signal is emitted at the end of the worker's run
+        # method, so wait for it to return rather than terminating it
+        self.worker.wait()
 
+    @Slot()
+    def show_previous_page(self):
+        """
+        Shows the previous page in the progress_widget, and updates the
+        state of the left and right buttons.
+        """
+        self.user_interface.progress_widget.setCurrentIndex(
+            self.user_interface.progress_widget.currentIndex() - 1
+        )
+        self.update_button_states()
+
+    @Slot()
+    def show_next_page(self):
+        """
+        Shows the next page in the progress_widget, and updates the state
+        of the left and right buttons.
+        """
+        self.user_interface.progress_widget.setCurrentIndex(
+            self.user_interface.progress_widget.currentIndex() + 1
+        )
+        self.update_button_states()
+
+    @Slot()
     def update_page_label(self):
         """
         Updates the page label to display the current page number out of the
@@ -1336,11 +1683,14 @@ class MainWindow(QMainWindow):
             f"{current_page} / {total_pages}"
         )
 
-    @staticmethod
-    def get_images(path=None):
+    def get_images(self, path=None):
         """
         Gathers all available images in the current directory and puts them
-        in a sorted list.
+        in a sorted list. The list is cached, so the fallback timer does not
+        rescan an unchanged directory. The cache is cleared whenever the
+        watcher reports a change, and is not trusted while the modification
+        time of the directory is recent, as a file renamed into place within
+        the same timestamp tick as the previous scan leaves it unchanged.
 
         :param path: The path to the directory containing the images.
         """
@@ -1348,47 +1698,72 @@ class MainWindow(QMainWindow):
         if path is None:
             return None
 
-        return sorted(glob(os.path.join(path, '*.html')))
+        # Use the modification time of the directory to validate the cache
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return []
+
+        # Return the cached list if the directory has not changed since it
+        # was scanned, and was last modified more than one timer interval ago
+        if (path, mtime) == self._cached_mtime and \
+                time.time_ns() - mtime > IMAGE_SCAN_INTERVAL * 1_000_000:
+            return self._cached_images
+
+        # Otherwise, rescan the directory and update the cache. os.scandir
+        # reuses the file type from the directory entry, so no additional
+        # stat calls are required. Hidden files are skipped, as with glob
+        try:
+            with os.scandir(path) as entries:
+                images = [
+                    entry.path for entry in entries
+                    if entry.name.endswith('.html')
+                    and not entry.name.startswith('.')
+                    and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return []
+        images.sort()
+        self._cached_images = images
+        self._cached_mtime = (path, mtime)
+
+        return self._cached_images
+
+    def iter_new_images(self):
+        """
+        Yields the images that have been added to the image directory since
+        the previous call.
+        """
+        # Gets all the images in the image directory
+        images = self.get_images(path=self.image_path) or []
+
+        # Keep the images that have not been added yet. They are compared
+        # against a set rather than sliced by position, because a new file
+        # can sort before existing ones (e.g. iteration_10 before
+        # iteration_2)
+        new_images = [
+            image for image in images if image not in self._known_images
+        ]
+        self._known_images.update(new_images)
 
-    def add_html_to_gui(self, html_path):
-        """
-        Adds HTML to the GUI.
-        """
+        yield from new_images
 
-        # Wait for the image file to be fully written
-        while True:
-            try:
-                size1 = os.path.getsize(html_path)
-                time.sleep(1)
-                size2 = os.path.getsize(html_path)
-                if size1 == size2:
-                    break
-            except FileNotFoundError:
-                time.sleep(1)
+    @staticmethod
+    def create_html_page():
+        """
+        Creates a page for the progress_widget containing a QTextBrowser to
+        display an HTML summary.
 
+        :return: The new page and its QTextBrowser
+        """
         # Create a new QWidget
         new_page = QWidget()
 
-        # Add the new QWidget to the progress_widget
-        self.user_interface.progress_widget.addWidget(new_page)
-
-        # Set the new QWidget as the current widget
-        self.user_interface.progress_widget.setCurrentWidget(new_page)
-
-        # Update the page label and button states
-        self.update_page_label()
-        self.update_button_states()
-
         # Create a QTextBrowser to display the HTML
         text_browser = QTextBrowser(new_page)
         text_browser.setObjectName(u"textBrowser")
         text_browser.setAlignment(Qt.AlignCenter)
 
-        # Load the HTML file into the QTextBrowser
-        with open(html_path, 'r') as f:
-            html_content = f.read()
-        text_browser.setHtml(html_content)
-
         # Set the size policy of the QTextBrowser to allow it to expand freely
         text_browser.setSizePolicy(
             QSizePolicy.Expanding,
@@ -1406,6 +1781,110 @@ class MainWindow(QMainWindow):
         # Add the QTextBrowser to the QVBoxLayout
         vertical_layout.addWidget(text_browser)
 
+        return new_page, text_browser
+
+    def add_html_files_to_gui(self, html_paths):
+        """
+        Adds a batch of HTML files to the GUI. Updates to the progress_widget
+        are disabled while the pages are added, so it is laid out and
+        repainted once per batch rather than once per page.
+
+        :param html_paths: List of paths to the HTML files to add
+        """
+        # Nothing to do if there are no new HTML files
+        if not html_paths:
+            return
+
+        progress_widget = self.user_interface.progress_widget
+
+        # Suspend repaints while the pages are added. Signals are blocked as
+        # well, so currentChanged does not update the page label per page
+        with batched_updates(progress_widget, block_signals=True):
+            for html_path in html_paths:
+                self.add_html_to_gui(html_path)
+
+            # Set the last page as the current widget
+            progress_widget.setCurrentIndex(progress_widget.count() - 1)
+
+        # Update the page label, rendered pages, and button states
+        self.update_page_label()
+        self.render_visible_pages()
+        self.update_button_states()
+
+    def add_html_to_gui(self, html_path):
+        """
+        Adds HTML to the GUI as a new page of the progress_widget. Pages left
+        over from a previous run are reused before new ones are created. Use
+        add_html_files_to_gui to also show the page, load its HTML, and
+        update the page label and button states.
+        """
+        # Reuse a page from the pool, or create a new one
+        if self.page_pool:
+            new_page, text_browser = self.page_pool.pop()
+        else:
+            new_page, text_browser = self.create_html_page()
+
+        # Add the page to the progress_widget. Its HTML is only loaded by
+        # render_visible_pages once the page is, or is next to, the current
+        # page
+        self.user_interface.progress_widget.addWidget(new_page)
+        self.pages.append((new_page, text_browser))
+        self.page_paths.append(html_path)
+
+    @Slot()
+    def render_visible_pages(self):
+        """
+        Loads the HTML of the current page and the pages either side of it,
+        and clears the QTextBrowsers of all other pages. Only a few parsed
+        documents are kept in memory, however long the run.
+        """
+        # Find the pages that should hold their HTML
+        current_index = self.user_interface.progress_widget.currentIndex()
+        visible_pages = {
+            index for index in range(
+                current_index - RENDERED_PAGE_RADIUS,
+                current_index + RENDERED_PAGE_RADIUS + 1
+            )
+            if 0 <= index < len(self.pages)
+        }
+
+        # Clear the pages that are no longer near the current page, and
+        # discard any HTML still being read for them
+        for index in self.rendered_pages - visible_pages:
+            self.pending_html.pop(self.page_paths[index], None)
+            self.pages[index][1].clear()
+
+        # Read the HTML of the newly visible pages in the thread pool. Each
+        # QTextBrowser is populated by the on_html_loaded slot once its file
+        # has been read
+        for index in visible_pages - self.rendered_pages:
+            html_path = self.page_paths[index]
+            self.pending_html[html_path] = self.pages[index][1]
+            loader = HtmlLoader(html_path=html_path)
+            loader.signals.loaded.connect(self.on_html_loaded)
+            QThreadPool.globalInstance().start(loader)
+
+        # Remember which pages hold their HTML
+        self.rendered_pages = visible_pages
+
+    def on_html_loaded(self, html_path, html_content):
+        """
+        Populates the QTextBrowser of a page once its HTML file has been read
+        by an HtmlLoader.
+
+        :param html_path: The path of the HTML file that was read
+        :param html_content: The contents of the HTML file
+        """
+        # Find the QTextBrowser waiting for this HTML file
+        text_browser = self.pending_html.pop(html_path, None)
+
+        # The page may have been removed by a new run in the meantime
+        if text_browser is None:
+            return
+
+        # Load the HTML into the QTextBrowser
+        text_browser.setHtml(html_content)
+
     def run_clicker(self):
         """
         This method is called when the run button is clicked. It starts the
@@ -1456,24 +1935,17 @@ class MainWindow(QMainWindow):
             self.user_interface.run_label_error.hide()
 
             # Resets the time to 0:00:00
-            self.time = QTime(0, 0, 0)
+            self._last_secs = 0
+            self.display_lcd('00:00:00')
+            self.elapsed.start()
 
-            # Disconnect the timeout signal from the lcd_number slot
-            # Check the flag before disconnecting
-            if self.is_lcd_number_connected:
-                self.timer.timeout.disconnect(self.lcd_number)
-                # Set the flag to False when the signal is disconnected
-                self.is_lcd_number_connected = False
+            # Start the timer, ticking slowly if the window is minimized
+            self.timer.start(60000 if self.isMinimized() else 1000)
 
-            # Reconnect the timeout signal to the lcd_number slot
-            self.timer.timeout.connect(self.lcd_number)
-            self.is_lcd_number_connected = True
-
-            # Start the timer
-            self.timer.start(1000)
-
-            # Create a shared value for the complete flag
-            complete = multiprocessing.Value('b', False)
+            # Create a shared value for the complete flag. It is a single
+            # byte that is only set by the GUI, so it does not need the lock
+            # that would otherwise be taken on every read in .main
+            complete = SPAWN_CONTEXT.Value('b', False, lock=False)
             self.complete = False
 
             # Create variable for the folder path
@@ -1489,10 +1961,14 @@ class MainWindow(QMainWindow):
                 configuration_file=self.configuration_file,
                 metadata_file=self.metadata_file,
                 lab_name=self.lab_name,
-                run_name=self.run_name,
-                pid_store=self.pid_store
+                run_name=self.run_name
             )
             self.worker.finished.connect(self.on_worker_finished)
+
+            # Start reading the image directory once .main has recreated it.
+            # Until then it still holds the summaries of the previous run
+            self.image_directory_ready = False
+            self.worker.output_ready.connect(self.start_image_monitoring)
             self.worker.start()
 
             # Connect the Worker's error signal to the update_error_label slot
@@ -1502,75 +1978,151 @@ class MainWindow(QMainWindow):
             self.user_interface.cancel_button.setCheckable(True)
             self.user_interface.cancel_button.setEnabled(True)
 
-            # Remove all widgets from progress_widget
-            for i in reversed(
-                    range(self.user_interface.progress_widget.count())):
-                self.user_interface.progress_widget.removeWidget(
-                    self.user_interface.progress_widget.widget(i)
-                )
+    @Slot()
+    def start_image_monitoring(self):
+        """
+        Resets the pages of the previous run, and starts watching the image
+        directory for new HTML files. This slot is connected to the
+        output_ready signal of the worker, which is emitted once .main has
+        recreated the image directory, so only files from the current run
+        are read.
+        """
+        # Move all pages from progress_widget into the page pool, so they can
+        # be reused by this run. Signals are blocked, so the changing current
+        # page does not load the pages being removed
+        progress_widget = self.user_interface.progress_widget
+        with batched_updates(progress_widget, block_signals=True):
+            for page, text_browser in reversed(self.pages):
+                progress_widget.removeWidget(page)
+                text_browser.clear()
+                self.page_pool.append((page, text_browser))
+        self.pages.clear()
+        self.page_paths.clear()
+        self.rendered_pages.clear()
+
+        # Reset the page label and button states
+        self.user_interface.pageLabel.setText("0 / 0")
+        self.update_button_states()
+
+        # Reset the images added to the GUI, and discard any pages still
+        # waiting for their HTML to be read
+        self._known_images.clear()
+        self.pending_html.clear()
+
+        # Watch the image directory for new HTML files, and pick up any that
+        # were written before the watcher was set up
+        self.image_directory_ready = True
+        if os.path.isdir(self.image_path):
+            self.fs_watcher.addPath(self.image_path)
+        self.image_timer.start()
+        self._on_dir_changed()
+
+    def cancel_clicker(self):
+        """
+        This method is called when the cancel button is clicked. It prompts
+        the user to confirm that the run should be stopped, and passes the
+        response to the dialog_clicked method.
+        """
+        # Create a message box to confirm the user wants to stop the run
+        message = CustomMessageBox()
+        message.setWindowTitle("Warning")
+        message.setText("Are you sure you want to stop the run?")
+        message.setIcon(QMessageBox.Warning)
 
-            # Reset the page label
-            self.user_interface.pageLabel.setText("0 / 0")
+        # Create the buttons for the message box
+        message.setStandardButtons(QMessageBox.Yes | QMessageBox.Cancel)
 
-            # Initialise the number of images added to the GUI
-            number_of_images = 0
+        # Move the message box to the center of the window
+        self.move_message(message=message)
 
-            # While loop to constantly look for new images to add into the GUI.
-            # Always adds the last image to the GUI
-            while not self.complete:
-                # Process events to keep the GUI responsive
-                QCoreApplication.processEvents()
+        # Display the message box and wait for the user to close it
+        response = message.exec()
 
-                # Gets all the images in the current directory
-                images = self.get_images(path=self.image_path)
+        # Pass the response to the dialog_clicked method
+        self.dialog_clicked(response)
+
+    def _on_dir_changed(self, path=None):
+        """
+        Adds any new HTML files in the image directory to the GUI. This slot
+        is connected to the directoryChanged signal of the file system
+        watcher, and to the timeout signal of the fallback image timer.
 
-                # Updates the state of the left and right buttons based on the
-                # current page index
-                # self.update_button_states()
+        :param path: The path of the directory that changed. It is only
+        provided by the watcher.
+        """
+        # Nothing to read until the PoreSippr process has recreated the
+        # image directory for the current run
+        if not self.image_directory_ready:
+            return
 
-                # If there are new images, add them to the GUI
-                if len(images) > number_of_images:
-                    for image_path in images[number_of_images:]:
-                        self.add_html_to_gui(image_path)
-                # Updates the number of images added
-                number_of_images = len(images)
+        # A change reported by the watcher invalidates the cached image list
+        if path is not None:
+            self._cached_mtime = None
 
-                # If the cancel button is checked, stop the run
-                if self.user_interface.cancel_button.isChecked():
+        # Re-add the image directory to the watcher if it has been recreated
+        # during a run
+        if self.image_timer.isActive() and \
+                self.image_path not in self.fs_watcher.directories() and \
+                os.path.isdir(self.image_path):
+            self.fs_watcher.addPath(self.image_path)
 
-                    # Create a message box to confirm the user wants to stop
-                    # the run
-                    message = CustomMessageBox()
-                    message.setWindowTitle("Warning")
-                    message.setText("Are you sure you want to stop the run?")
-                    message.setIcon(QMessageBox.Warning)
+        # Add any new images to the GUI
+        self.add_html_files_to_gui(list(self.iter_new_images()))
 
-                    # Create the buttons for the message box
-                    message.setStandardButtons(
-                        QMessageBox.Yes | QMessageBox.Cancel)
+    def stop_image_monitoring(self):
+        """
+        Stops watching the image directory for new HTML files, and re-enables
+        the run and configuration buttons.
+        """
+        # Stop the fallback timer and the file system watcher
+        self.image_timer.stop()
+        if self.fs_watcher.directories():
+            self.fs_watcher.removePaths(self.fs_watcher.directories())
 
-                    # Connect the buttonClicked signal to the dialog_clicked
-                    message.buttonClicked.connect(self.dialog_clicked)
+        # Enable the run button again after the run is finished or cancelled
+        self.user_interface.run_button.setEnabled(True)
 
-                    # Move the message box to the center of the window
-                    self.move_message(message=message)
+        # Enable the configuration_button
+        self.user_interface.configuration_button.setEnabled(True)
 
-                    # Display the message box and wait for the user to close it
-                    response = message.exec()
+    def stop_worker(self, timeout=5000):
+        """
+        Stops the PoreSippr run. The shared complete flag is set first, so
+        .main terminates the basecalling process and exits on its own. The
+        external processes are only killed, and the worker thread only
+        terminated, if the run has not stopped within the timeout.
 
-                    # Pass the response to the dialog_clicked method
-                    self.dialog_clicked(response)
+        :param timeout: Milliseconds to wait for the run to stop.
+        """
+        # Set the complete flag, and ask .main to stop
+        self.complete = True
+        if self.worker is None:
+            return
+        self.worker.complete.value = True
 
-                    # Process all pending events
-                    QCoreApplication.processEvents()
+        # Give .main time to stop the basecalling process and exit
+        if self.worker.wait(timeout):
+            return
 
-            # Enable the run button again after the run is finished or
-            # cancelled
-            self.user_interface.run_button.setEnabled(True)
+        # Terminate the basecalling process and the .main process, which
+        # also lets the worker thread return from waiting on .main. A PID of
+        # 0 means the process was never started
+        pids = [self.worker.basecall_pid.value]
+        if self.worker.process is not None:
+            pids.append(self.worker.process.pid)
+        for pid in pids:
+            if not pid:
+                continue
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass  # Process might have already terminated
 
-            # Enable the configuration_button
-            self.user_interface.configuration_button.setEnabled(True)
+        # Terminate the worker thread as a last resort
+        if not self.worker.wait(timeout):
+            self.worker.terminate()
 
+    @Slot(int)
     def dialog_clicked(self, response):
         """
         Handles the event when a dialog button is clicked.
@@ -1593,6 +2145,9 @@ class MainWindow(QMainWindow):
             # Set the complete flag to True
             self.complete = True
 
+            # Stop watching the image directory for new images
+            self.stop_image_monitoring()
+
             # Uncheck the run button
             self.user_interface.run_button.setChecked(False)
 
@@ -1621,28 +2176,14 @@ class MainWindow(QMainWindow):
             # Allow the sequence_info_button to be clicked
             self.user_interface.sequence_info_button.setCheckable(True)
 
-            # Terminate the worker thread
-            self.worker.terminate()
-
-            # Terminate any external processes
-            for pid in self.pid_store:
-                try:
-                    os.kill(pid, signal.SIGTERM)
-                except ProcessLookupError:
-                    pass  # Process might have already terminated
+            # Stop the run
+            self.stop_worker()
 
             # Update the number of pages
             self.update_button_states()
 
-            # Get the list of images after the dialog box is closed
-            images = self.get_images(path=self.image_path)
-
-            # If there are new images, add them to the GUI
-            if len(images) > self.user_interface.progress_widget.count():
-                for image_path in images[
-                                  self.user_interface.progress_widget
-                                  .count():]:
-                    self.add_html_to_gui(image_path)
+            # Add any images created before the dialog box was closed
+            self._on_dir_changed()
 
         # Check if the "Cancel" button was clicked
         elif response == QMessageBox.Cancel:
@@ -1695,14 +2236,7 @@ class MainWindow(QMainWindow):
             # If the user clicked 'Yes', kill the process and accept
             # the close event
             if response == QMessageBox.Yes:
-                self.complete = True
-                self.worker.terminate()
-                # Additionally, terminate any external processes
-                for pid in self.pid_store:
-                    try:
-                        os.kill(pid, signal.SIGTERM)
-                    except ProcessLookupError:
-                        pass  # Process might have already terminated
+                self.stop_worker()
                 event.accept()
             # If the user clicked 'Cancel', ignore the close event
             else:
@@ -1746,8 +2280,26 @@ class UIFunctions:
         # Set the global title bar flag to True
         self.global_title_bar = True
 
-        # Create a shadow effect
-        self.shadow = QGraphicsDropShadowEffect()
+        # Initialise the title bar flag the user interface definitions were
+        # last applied with
+        self._defined_title_bar = None
+
+        # Initialise the widgets in the top button frame. They are looked up
+        # the first time the window is maximized
+        self._top_buttons_widgets = None
+
+        # Initialise the nine-slice pixmap used to draw the shadow. It is
+        # rendered on first use
+        self._shadow_pixmap = None
+
+        # Create the maximize and restore icons once, rather than on every
+        # toggle of the maximize/restore button
+        self.maximize_icon = QIcon(
+            u":/16x16/icons/16x16/cil-window-maximize.png"
+        )
+        self.restore_icon = QIcon(
+            u":/16x16/icons/16x16/cil-window-restore.png"
+        )
 
         # Create a size grip
         self.sizegrip = QSizeGrip(self.user_interface.frame_size_grip)
@@ -1779,15 +2331,11 @@ class UIFunctions:
 
             # Set the maximize/restore button icon to the restore icon
             self.user_interface.maximize_restore_button.setIcon(
-                QIcon(
-                    u":/16x16/icons/16x16/cil-window-restore.png"
-                )
+                self.restore_icon
             )
 
             # Set the top button frame background color to black
-            self.user_interface.frame_top_btns.setStyleSheet(
-                "background-color: rgb(27, 29, 35)"
-            )
+            self.set_top_buttons_maximized(True)
 
             # Hide the size grip
             self.user_interface.frame_size_grip.hide()
@@ -1806,9 +2354,9 @@ class UIFunctions:
                 self.main_window.width() + 1, self.main_window.height() + 1
             )
 
-            # Set the contents margins to 10
+            # Restore the margin that holds the shadow
             self.user_interface.horizontalLayout.setContentsMargins(
-                10, 10, 10, 10
+                WINDOW_MARGIN, WINDOW_MARGIN, WINDOW_MARGIN, WINDOW_MARGIN
             )
 
             # Set the maximize/restore button tooltip to 'Maximize'
@@ -1816,26 +2364,136 @@ class UIFunctions:
 
             # Set the maximize/restore button icon to the maximize icon
             self.user_interface.maximize_restore_button.setIcon(
-                QIcon(
-                    u":/16x16/icons/16x16/cil-window-maximize.png"
-                )
+                self.maximize_icon
             )
 
-            # Set the top button frame background color to black
-            self.user_interface.frame_top_btns.setStyleSheet(
-                "background-color: rgba(27, 29, 35, 200)"
-            )
+            # Set the top button frame background color to translucent black
+            self.set_top_buttons_maximized(False)
 
             # Show the size grip
             self.user_interface.frame_size_grip.show()
 
-    def return_status(self) -> bool:
+    def shadow_pixmap(self):
         """
-        Returns the status of the window (maximized or restored).
+        Returns the nine-slice pixmap of the drop shadow, rendering it the
+        first time it is needed. The pixmap is a blurred rectangle with
+        SHADOW_MARGIN pixel corners and one pixel edges, so drawing it only
+        stretches and copies pixels rather than blurring the frame on every
+        repaint.
+        :return: The shadow pixmap.
+        """
+        # Return the cached pixmap
+        if self._shadow_pixmap is not None:
+            return self._shadow_pixmap
+
+        # Approximate the blur with a Gaussian
+        sigma = SHADOW_BLUR_RADIUS / 3
+        size = 2 * SHADOW_MARGIN + 1
 
-        :return: The status of the window.
+        def coverage(index):
+            """
+            Fraction of the shadow covering a pixel in one dimension, from
+            the distance between the pixel centre and the edge of the frame.
+            """
+            if index == SHADOW_MARGIN:
+                return 1.0
+            if index < SHADOW_MARGIN:
+                distance = SHADOW_MARGIN - (index + 0.5)
+            else:
+                distance = index + 0.5 - (SHADOW_MARGIN + 1)
+            return 0.5 * math.erfc(distance / (sigma * math.sqrt(2)))
+
+        # Draw the blurred rectangle pixel by pixel
+        image = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+        for x in range(size):
+            for y in range(size):
+                color = QColor(SHADOW_COLOR)
+                color.setAlphaF(
+                    SHADOW_COLOR.alphaF() * coverage(x) * coverage(y)
+                )
+                image.setPixelColor(x, y, color)
+
+        self._shadow_pixmap = QPixmap.fromImage(image)
+        return self._shadow_pixmap
+
+    def draw_shadow(self, painter, rect):
+        """
+        Draws the drop shadow around a rectangle from the nine-slice shadow
+        pixmap. The centre of the rectangle is left untouched.
+        :param painter: The QPainter to draw with.
+        :param rect: The QRect of the frame casting the shadow.
         """
-        return self.is_maximized
+        pixmap = self.shadow_pixmap()
+        margin = SHADOW_MARGIN
+        left = rect.left()
+        top = rect.top()
+        right = rect.left() + rect.width()
+        bottom = rect.top() + rect.height()
+
+        # Draw the corners
+        painter.drawPixmap(
+            left - margin, top - margin, pixmap, 0, 0, margin, margin
+        )
+        painter.drawPixmap(
+            right, top - margin, pixmap, margin + 1, 0, margin, margin
+        )
+        painter.drawPixmap(
+            left - margin, bottom, pixmap, 0, margin + 1, margin, margin
+        )
+        painter.drawPixmap(
+            right, bottom, pixmap, margin + 1, margin + 1, margin, margin
+        )
+
+        # Stretch the one pixel slices along the edges
+        painter.drawPixmap(
+            QRect(left, top - margin, rect.width(), margin),
+            pixmap, QRect(margin, 0, 1, margin)
+        )
+        painter.drawPixmap(
+            QRect(left, bottom, rect.width(), margin),
+            pixmap, QRect(margin, margin + 1, 1, margin)
+        )
+        painter.drawPixmap(
+            QRect(left - margin, top, margin, rect.height()),
+            pixmap, QRect(0, margin, margin, 1)
+        )
+        painter.drawPixmap(
+            QRect(right, top, margin, rect.height()),
+            pixmap, QRect(margin + 1, margin, margin, 1)
+        )
+
+    def top_buttons_widgets(self):
+        """
+        Returns the top button frame and all of its child widgets. The
+        children are fixed by the generated user interface, so the object
+        tree is only searched the first time.
+        :return: List of the frame and its child widgets.
+        """
+        if self._top_buttons_widgets is None:
+            frame = self.user_interface.frame_top_btns
+            self._top_buttons_widgets = \
+                [frame] + frame.findChildren(QWidget)
+        return self._top_buttons_widgets
+
+    def set_top_buttons_maximized(self, maximized):
+        """
+        Sets the maximized property used by the application style sheet to
+        choose the background color of the top button frame, and re-polishes
+        the frame and its children so the change takes effect.
+        :param maximized: Boolean value of the maximized property.
+        """
+        # Set the dynamic property
+        frame = self.user_interface.frame_top_btns
+        frame.setProperty("maximized", maximized)
+
+        # The rules also match the children of the frame, so they need to be
+        # re-polished as well
+        style = frame.style()
+        for widget in self.top_buttons_widgets():
+            style.unpolish(widget)
+            style.polish(widget)
+        frame.update()
 
     def remove_title_bar(self, status):
         """
@@ -1851,7 +2509,10 @@ class UIFunctions:
         This method sets the text of the title label at the top of the window.
         :param text: The text to set as the title.
         """
-        self.user_interface.label_title_bar_top.setText(text)
+        # Skip the relayout and repaint if the title is unchanged
+        label = self.user_interface.label_title_bar_top
+        if label.text() != text:
+            label.setText(text)
 
     def label_description(self, text):
         """
@@ -1860,82 +2521,115 @@ class UIFunctions:
         window.
         :param text: The text to set as the description.
         """
-        self.user_interface.label_top_info_1.setText(text)
+        # Skip the relayout and repaint if the description is unchanged
+        label = self.user_interface.label_top_info_1
+        if label.text() != text:
+            label.setText(text)
 
     def double_click_maximize_restore(self, event):
         """
-        Maximize/Restore the window when the title bar is double-clicked.
+        Maximize/Restore the window when the title bar is double-clicked with
+        the left mouse button. Other double-clicks are passed on to the
+        default handler of the frame.
         """
-        # Check if the event type is MouseButtonDblClick
-        if event.type() == QEvent.MouseButtonDblClick:
+        # Qt only calls this handler for double-clicks, so only the button
+        # needs to be checked
+        if event.button() == LEFT_BUTTON:
             # Maximize/Restore the window
-            UIFunctions.maximize_restore(self)
+            self.maximize_restore()
+        else:
+            QFrame.mouseDoubleClickEvent(
+                self.user_interface.frame_label_top_btns, event
+            )
 
     def user_interface_definitions(self):
         """
-        Set the user interface definitions. This method sets the style of the
-        window, the title bar, the size grip, and the buttons. It also connects
-        the buttons to their respective functions.
+        Set the user interface definitions. This method sets the window
+        attributes, the title bar, and the size grip. The buttons are
+        connected afterwards, in finish_ui_setup.
         """
+        # Nothing to do if the definitions have already been applied for the
+        # current title bar flag
+        if self._defined_title_bar == self.global_title_bar:
+            return
+        self._defined_title_bar = self.global_title_bar
+
+        # Bind the widgets used repeatedly below to locals
+        user_interface = self.user_interface
+        frame_label_top_btns = user_interface.frame_label_top_btns
+
+        # Suspend painting while the window flags, margins and visibility
+        # are changed, so they are laid out and painted once
+        with batched_updates(self.main_window):
+            # Check if the global title bar flag is True
+            if self.global_title_bar:
+
+                # Only make the window translucent when the shadow is drawn
+                # in its margin, as a translucent window has to be alpha
+                # blended by the compositor on every frame
+                if ENABLE_DROP_SHADOW:
+                    self.main_window.setAttribute(Qt.WA_TranslucentBackground)
+                else:
+                    user_interface.horizontalLayout.setContentsMargins(
+                        0, 0, 0, 0
+                    )
 
-        # Check if the global title bar flag is True
-        if self.global_title_bar:
-
-            # Set the main window flags to FramelessWindowHint
-            self.main_window.setAttribute(Qt.WA_TranslucentBackground)
-
-            # Enable double-click to maximize/restore the window
-            self.user_interface.frame_label_top_btns.mouseDoubleClickEvent = \
-                self.double_click_maximize_restore
-        else:
-            # Set the margins of the horizontal layout to 0
-            self.user_interface.horizontalLayout.setContentsMargins(0, 0, 0, 0)
-
-            # Set the margins of the frame label top buttons to 8, 0, 0, 5
-            self.user_interface.frame_label_top_btns.setContentsMargins(
-                8, 0, 0, 5
-            )
+                # Enable double-click to maximize/restore the window
+                frame_label_top_btns.mouseDoubleClickEvent = \
+                    self.double_click_maximize_restore
+            else:
+                # Set the margins of the horizontal layout to 0
+                user_interface.horizontalLayout.setContentsMargins(0, 0, 0, 0)
 
-            # Set the minimum height of the frame label top buttons to 42
-            self.user_interface.frame_label_top_btns.setMinimumHeight(42)
+                # Set the margins of the frame label top buttons to 8, 0, 0, 5
+                frame_label_top_btns.setContentsMargins(TITLE_BAR_MARGINS)
 
-            # Hide the user icon, title bar, and buttons
-            self.user_interface.frame_icon_top_bar.hide()
-            self.user_interface.frame_btns_right.hide()
-            self.user_interface.frame_size_grip.hide()
+                # Set the minimum height of the frame label top buttons to 42
+                frame_label_top_btns.setMinimumHeight(42)
 
-        # Set the style of the window
-        self.shadow.setBlurRadius(17)
-        self.shadow.setXOffset(0)
-        self.shadow.setYOffset(0)
-        self.shadow.setColor(QColor(0, 0, 0, 150))
-        self.user_interface.frame_main.setGraphicsEffect(self.shadow)
+                # Hide the user icon, title bar, and buttons
+                user_interface.frame_icon_top_bar.hide()
+                user_interface.frame_btns_right.hide()
+                user_interface.frame_size_grip.hide()
 
+    def finish_ui_setup(self):
+        """
+        Finish setting up the user interface once the window has been shown.
+        This method connects the title bar buttons to their respective
+        functions. This is not needed for the first frame, so it is posted to
+        the event loop rather than delaying the window from appearing. The
+        connections are unique, so calling this method again does not make a
+        click fire its slot twice, and queued, so the button is released and
+        repainted before the window manager is asked to change the window.
+        """
         # Minimize the window when the minimize button is clicked
         self.user_interface.minimize_button.clicked.connect(
-            lambda: self.main_window.showMinimized()
+            self.main_window.showMinimized, QUEUED_UNIQUE_CONNECTION
         )
 
         # Maximize/Restore the window when the maximize/restore button
         # is clicked
         self.user_interface.maximize_restore_button.clicked.connect(
-            self.main_window.user_interface_functions.maximize_restore
+            self.maximize_restore, QUEUED_UNIQUE_CONNECTION
         )
 
         # Close the window when the close button is clicked
         self.user_interface.close_button.clicked.connect(
-            lambda: self.main_window.close()
+            self.main_window.close, QUEUED_UNIQUE_CONNECTION
         )
 
 
 if __name__ == "__main__":
+    # Let the spawned PoreSippr process run its target, rather than start
+    # another GUI, when the application is frozen into an executable
+    multiprocessing.freeze_support()
 
     # # Print the $PATH environment variable
     # print("Current $PATH:", os.environ['PATH'])
     #
     # # Determine the base path of the current Python file
-    base_path = determine_script_path()
-
+    # base_path = determine_script_path()
+    #
     # os.environ['PATH'] = base_path + os.pathsep + os.environ['PATH']
     #
     # print("Updated $PATH:", os.environ['PATH'])
@@ -1943,14 +2637,15 @@ if __name__ == "__main__":
     # Create the application
     app = QApplication(sys.argv)
 
-    # Ensure that the event loop is interrupted by SIGINT
-    timer = QTimer()
-    timer.start(500)  # Every 500ms, the event loop will be interrupted
-    timer.timeout.connect(lambda: None)
+    # Use the built-in Fusion style rather than probing for the platform
+    # style. Almost every widget is drawn by style sheets on top of it anyway
+    app.setStyle('Fusion')
+
+    # Apply the application-wide style sheet
+    app.setStyleSheet(APP_STYLE_SHEET)
 
-    QFontDatabase.addApplicationFont(os.path.join(
-        base_path, 'fonts', 'segoeui.ttf'))
-    QFontDatabase.addApplicationFont(
-        os.path.join(base_path, 'fonts', 'segoeuib.ttf'))
+    # Load the fonts from the compiled resource bundle rather than from disk
+    QFontDatabase.addApplicationFont(':/fonts/fonts/segoeui.ttf')
+    QFontDatabase.addApplicationFont(':/fonts/fonts/segoeuib.ttf')
     window = MainWindow()
     app.exec()
@@ -10,15 +10,16 @@ import base64
 from collections import defaultdict
 import csv
 from datetime import datetime
+from functools import lru_cache
 import glob
 import multiprocessing
 import os
 import re
 import shutil
+import signal
 import subprocess
 import sys
 import threading
-from time import sleep
 
 # Third-party imports
 from Bio import SeqIO
@@ -55,41 +56,29 @@ def determine_script_path():
 
 def read_csv_file(file_path):
     """
-    This function reads a CSV file and returns a pandas DataFrame.
+    This function reads a configuration CSV file and returns a dictionary
+    where the keys are the column headers and the values are the values in
+    the first row. The file is small, so it is parsed with csv.DictReader
+    rather than building a pandas DataFrame.
 
     Parameters:
     file_path (str): The path to the CSV file.
 
-    Returns:
-    pd.DataFrame: The DataFrame containing the CSV data.
-    """
-    df = pd.read_csv(file_path)
-    return df
-
-
-def parse_dataframe(df):
-    """
-    This function parses a DataFrame and returns a dictionary where the keys
-    are the column headers and the values are the values in the first row.
-
-    Parameters:
-    df (pd.DataFrame): The DataFrame to parse.
-
     Returns:
     dict: A dictionary where the keys are the column headers and the values
     are the values in the first row.
 
     Raises:
-    ValueError: If the DataFrame is empty.
+    ValueError: If the CSV file has no data rows.
     """
-    if df.empty:
-        raise ValueError("The DataFrame is empty")
+    with open(file_path, 'r', newline='') as f:
+        reader = csv.DictReader(f)
 
-    # Get the first row of the DataFrame
-    first_row = df.iloc[0]
+        # Get the first row of the CSV file
+        data_dict = next(reader, None)
 
-    # Convert the first row to a dictionary
-    data_dict = first_row.to_dict()
+    if data_dict is None:
+        raise ValueError("The CSV file is empty")
 
     return data_dict
 
@@ -129,18 +118,40 @@ def validate_headers(data_dict):
 
 def is_valid_fasta(file_path):
     """
-    This function checks if a file is a valid FASTA file.
+    This function checks if a file is a valid FASTA file. The result is
+    cached on the path, modification time, and size of the file, so
+    re-validating an unchanged file does not parse it again.
     :param file_path:
     :return:
     """
     try:
-        # Attempt to parse the file as FASTA
-        records = list(SeqIO.parse(file_path, "fasta"))
+        stat = os.stat(file_path)
+    except OSError as e:
+        # If the file cannot be accessed, it is not a valid FASTA file
+        print(f"Error parsing file: {e}")
+        return False
+
+    return _is_valid_fasta_cached(
+        file_path, stat.st_mtime_ns, stat.st_size
+    )
+
+
+@lru_cache(maxsize=16)
+def _is_valid_fasta_cached(file_path, _mtime, _size):
+    """
+    Parse a file as FASTA. The modification time and size are only used as
+    part of the cache key of is_valid_fasta.
+    :param file_path: The path to the file.
+    :param _mtime: The modification time of the file in nanoseconds.
+    :param _size: The size of the file in bytes.
+    :return: True if the file contains at least one FASTA record.
+    """
+    try:
+        # Attempt to parse the file as FASTA. Only the first record is
+        # needed, so stop there rather than parsing the whole reference
+        first_record = next(SeqIO.parse(file_path, "fasta"), None)
         # Check if there is at least one record
-        if len(records) > 0:
-            return True
-        else:
-            return False
+        return first_record is not None
     except Exception as e:
         # If parsing fails, the file is not a valid FASTA file
         print(f"Error parsing file: {e}")
@@ -299,7 +310,10 @@ def get_csv_files_by_iteration(folder_path):
 
 def parse_csv_file(csv_file):
     """
-    Parse a CSV file into a pandas DataFrame.
+    Parse a CSV file into a pandas DataFrame. Only the columns used by
+    create_data_dict are read, and both are read as strings, which skips
+    pandas' per-column type inference ('number_of_reads_mapped' contains
+    coverage values such as '12.3X', and is converted to numeric later).
 
     Parameters:
     csv_file (str): The path to the CSV file.
@@ -307,7 +321,12 @@ def parse_csv_file(csv_file):
     Returns:
     pd.DataFrame: The DataFrame containing the CSV data.
     """
-    df = pd.read_csv(csv_file)
+    df = pd.read_csv(
+        csv_file,
+        usecols=['gene_name', 'number_of_reads_mapped'],
+        dtype=str,
+        engine='c'
+    )
     return df
 
 
@@ -465,9 +484,27 @@ def create_data_dict(df, csv_file, metadata_dict):
     return data_dict
 
 
+def write_file_atomically(file_path, text):
+    """
+    This function writes text to a temporary file next to the given path,
+    and then renames it over the path. Readers never see a partially
+    written file.
+
+    Parameters:
+    file_path (str): The path to the file.
+    text (str): The text to write.
+    """
+    temp_path = f'{file_path}.tmp'
+    with open(temp_path, 'w') as f:
+        f.write(text)
+    os.replace(temp_path, file_path)
+
+
 def visualize_data(all_data_df, output_path):
     """
-    Visualize the data in a DataFrame as a table and save it to a file.
+    Visualize the data in a DataFrame as a table and save it to a file. The
+    index column is removed before the file is written, so the file is only
+    written once.
 
     Parameters:
     all_data_df (pd.DataFrame): The DataFrame to visualize.
@@ -535,21 +572,19 @@ def visualize_data(all_data_df, output_path):
         }
     </style>
     """
-    # Save the styled DataFrame to an HTML file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(css)
-        f.write(styled_df.to_html())
+    # Remove the index column, and save the styled DataFrame to an HTML file
+    write_file_atomically(
+        file_path=output_path,
+        text=remove_index_from_html(html=css + styled_df.to_html())
+    )
 
 
-def remove_index_from_html(html_file_path):
+def remove_index_from_html(html):
     """
-    Remove the index column from an HTML file.
-    :param html_file_path: The path to the HTML file.
+    Remove the index column from an HTML table.
+    :param html: The HTML containing the table.
+    :return: The HTML without the index column.
     """
-    # Read the HTML file
-    with open(html_file_path, 'r') as f:
-        html = f.read()
-
     # Parse the HTML
     soup = BeautifulSoup(html, 'html.parser')
 
@@ -563,9 +598,7 @@ def remove_index_from_html(html_file_path):
     for th in table.tbody.find_all('th'):
         th.decompose()
 
-    # Write the modified HTML back to the file
-    with open(html_file_path, 'w') as f:
-        f.write(str(soup))
+    return str(soup)
 
 
 def image_to_base64(image_path):
@@ -674,7 +707,8 @@ def main(
             sleep_time=20,
             lab_name='OLC',
             run_name='None',
-            pid_store=None):
+            basecall_pid=None,
+            output_ready=None):
     """
     Main function to process all CSV files in a folder grouped by iteration.
 
@@ -687,6 +721,12 @@ def main(
     config_file (str): The path to the configuration file. Default is None.
     test (bool): A flag to indicate if the function is being run in test mode.
     sleep_time (int): The time to sleep between iterations. Default is 20.
+    basecall_pid (multiprocessing.Value): Receives the PID of the
+        basecalling process, so the GUI can kill it if the run does not stop
+        on its own. Default is None.
+    output_ready (multiprocessing.Event): Set once the output folder has
+        been recreated, so the GUI knows it can start reading it. Default is
+        None.
     """
     # Read the config file and extract the barcode_values
     with open(config_file, 'r') as f:
@@ -713,6 +753,10 @@ def main(
         shutil.rmtree(output_folder)
     os.makedirs(output_folder, exist_ok=True)
 
+    # Let the GUI know that the output folder only holds files from this run
+    if output_ready is not None:
+        output_ready.set()
+
     # Delete the processed_folder if it exists and recreate it
     processed_folder = os.path.join(folder_path, 'processed')
     if os.path.exists(processed_folder):
@@ -763,14 +807,19 @@ def main(
     stdout_thread.start()
     stderr_thread.start()
 
-    # Store the PID in pid_store if it's provided
-    if pid_store is not None:
-        pid_store.append(worker_process.pid)
+    # Share the PID of the basecalling process if requested
+    if basecall_pid is not None:
+        basecall_pid.value = worker_process.pid
 
     while True:
 
-        # Sleep for 1 second to allow the worker process to run
-        sleep(1)
+        # Give the worker process up to 1 second to run. Waiting on the
+        # process rather than sleeping means its exit is noticed as soon as
+        # it happens
+        try:
+            worker_process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            pass
 
         # Check if the process should be stopped
         if complete.value:
@@ -835,6 +884,10 @@ def main(
             # Create the report folder if it doesn't exist
             os.makedirs(report_folder, exist_ok=True)
 
+            # Initialise the CSV files processed for the iteration in this
+            # pass
+            processed_csv_files = []
+
             for csv_file in sorted(csv_files_for_iteration):
                 # Check if the CSV file has already been processed
                 if os.path.exists(
@@ -842,7 +895,7 @@ def main(
                             processed_folder,
                             os.path.basename(csv_file))):
                     continue
-                
+
                 # Process the CSV file
                 df = parse_csv_file(csv_file)
                 data_dict = create_data_dict(
@@ -851,19 +904,19 @@ def main(
                     metadata_dict=link_dict
                 )
                 all_data.append(data_dict)
+                processed_csv_files.append(csv_file)
 
-                # Create the HTML table
+            # Create the HTML table once all the CSV files of the iteration
+            # have been processed, so the GUI only ever reads the complete
+            # table
+            if processed_csv_files:
                 visualize_data(
                     all_data_df=pd.DataFrame(all_data),
                     output_path=output_path
                 )
 
-                # Remove the index column from the HTML file
-                remove_index_from_html(
-                    html_file_path=output_path
-                )
-
-                # Move the processed CSV file to a different folder
+            # Move the processed CSV files to a different folder
+            for csv_file in processed_csv_files:
                 shutil.move(csv_file, processed_folder)
 
             # Create the PDF report
@@ -897,9 +950,31 @@ def main(
                 break
 
 
+def run_main(error_queue, **kwargs):
+    """
+    Entry point for running main in a separate process. Exceptions cannot
+    cross the process boundary, so any error raised by main is put on the
+    queue for the GUI to report.
+
+    Parameters:
+    error_queue (multiprocessing.SimpleQueue): Queue to receive the error
+        message if main fails.
+    kwargs: Keyword arguments passed through to main.
+    """
+    # A Ctrl+C in the terminal is delivered to this process as well. Leave
+    # it to the GUI, which asks the user and stops the run through the
+    # complete flag
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    try:
+        main(**kwargs)
+    except Exception as exc:
+        error_queue.put(str(exc))
+
+
 if __name__ == "__main__":
     # Create a shared value for the complete flag
-    process_complete = multiprocessing.Value('b', False)
+    process_complete = multiprocessing.Value('b', False, lock=False)
 
     # Get the directory of the current script
     script_dir = os.path.dirname(os.path.realpath(__file__))
@@ -399,7 +399,6 @@ class Ui_MainWindow(object):
         self.frame_top_btns = QFrame(self.frame_top_right)
         self.frame_top_btns.setObjectName(u"frame_top_btns")
         self.frame_top_btns.setMaximumSize(QSize(16777215, 42))
-        self.frame_top_btns.setStyleSheet(u"background-color: rgba(27, 29, 35, 200)")
         self.frame_top_btns.setFrameShape(QFrame.Shape.NoFrame)
         self.frame_top_btns.setFrameShadow(QFrame.Shadow.Raised)
         self.horizontalLayout_4 = QHBoxLayout(self.frame_top_btns)
@@ -723,6 +722,11 @@ class Ui_MainWindow(object):
 "    border: 3px solid rgb(128, 128, 128); /* Grey border when disabled */\n"
 "    color: rgb(255, 255, 255); /* White text when d"
                         "isabled */\n"
+"}\n"
+"QPushButton[finalized=\"true\"], QPushButton[finalized=\"true\"]:disabled {\n"
+"    background-color: rgb(92, 184, 92); /* Green once finalized */\n"
+"    border: 3px solid rgb(92, 184, 92); /* Green border once finalized */\n"
+"    font-weight: bold; /* Bold font */\n"
 "}")
 
         self.horizontalLayout_13.addWidget(self.configuration_button)
@@ -754,6 +758,11 @@ class Ui_MainWindow(object):
 "    border: 3px solid rgb(128, 128, 128); /* Grey border when disabled */\n"
 "    color: rgb(255, 255, 255); /* White text when d"
                         "isabled */\n"
+"}\n"
+"QPushButton[finalized=\"true\"], QPushButton[finalized=\"true\"]:disabled {\n"
+"    background-color: rgb(92, 184, 92); /* Green once finalized */\n"
+"    border: 3px solid rgb(92, 184, 92); /* Green border once finalized */\n"
+"    font-weight: bold; /* Bold font */\n"
 "}")
 
         self.horizontalLayout_13.addWidget(self.sequence_info_button)
@@ -988,7 +997,7 @@ class Ui_MainWindow(object):
 "	background-position: center;\n"
 "	background-repeat: no-repeat;\n"
 "}")
-        self.label_user_icon.setPixmap(QPixmap(u"icons/24x24/olcConfindrLogo.png"))
+        self.label_user_icon.setPixmap(QPixmap(u":/24x24/icons/24x24/olcConfindrLogo.png"))
         self.label_user_icon.setScaledContents(True)
         self.label_user_icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
 